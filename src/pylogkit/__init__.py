@@ -2,13 +2,17 @@
 PyLogKit public package interface.
 """
 
+from typing import Any
+
 from .config import LogConfig
 from .core import (
     LoggingNotInitializedError,
     attach_qt,
     audit,
+    flush_logging,
     init_logging,
     log,
+    set_level,
     shutdown_logging,
 )
 from .utils import catch_exceptions
@@ -22,7 +26,32 @@ __all__ = [
     "attach_qt",
     "audit",
     "catch_exceptions",
+    "flush_logging",
     "init_logging",
     "log",
+    "set_level",
     "shutdown_logging",
 ]
+
+# qt_integration (and its PyQt detection) is only imported on first
+# access of one of these names, keeping package import cheap for
+# non-Qt consumers (PEP 562).
+_QT_EXPORTS = frozenset(
+    {
+        "LogSignalEmitter",
+        "QtLogHandler",
+        "QtLoggingHandler",
+        "get_pyqt_version",
+        "has_pyqt",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _QT_EXPORTS:
+        from . import qt_integration
+
+        value = getattr(qt_integration, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,12 +4,17 @@ Logging configuration helpers for PyLogKit.
 
 from __future__ import annotations
 
+import functools
 import os
 import platform
-from dataclasses import dataclass
+import warnings
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+# platform.system() never changes within a process; resolve it once.
+_SYSTEM = platform.system()
+
 # Environment variable names
 ENV_LOG_LEVEL = "LOG_LEVEL"
 ENV_LOG_DIR = "LOG_DIR"
@@ -26,6 +31,11 @@ DEFAULT_ROTATION = "10 MB"
 DEFAULT_RETENTION = "7 days"
 DEFAULT_ENCODING = "utf-8"
 DEFAULT_APP_NAME = "app"
+DEFAULT_AUDIT_BATCH_SIZE = 100
+DEFAULT_AUDIT_FLUSH_INTERVAL = 0.1
+DEFAULT_AUDIT_MAX_QUEUE = 10000
+DEFAULT_AUDIT_OVERFLOW_POLICY = "drop_oldest"
+DEFAULT_AUDIT_BUFFER_BYTES = 64 * 1024
 
 _TRUE_VALUES = {"1", "true", "yes", "on"}
 _FALSE_VALUES = {"0", "false", "no", "off"}
@@ -44,24 +54,26 @@ def parse_env_bool(value: str | None, default: bool) -> bool:
     return default
 
 
+@functools.cache
 def get_default_log_dir(app_name: str = DEFAULT_APP_NAME) -> Path:
     """
     Return the default log directory for the current platform.
 
+    The result is memoized per app name; repeated config construction
+    (from_env in loops, tests) costs a cache lookup only.
+
     Paths:
     - Windows: %APPDATA%\\{app_name}\\logs
     - macOS: ~/Library/Application Support/{app_name}/logs
     - Linux/Unix: ~/.local/share/{app_name}/logs
     """
-    system = platform.system()
-
-    if system == "Windows":
+    if _SYSTEM == "Windows":
         appdata = os.environ.get("APPDATA")
         if appdata:
             return Path(appdata) / app_name / "logs"
         return Path.home() / "AppData" / "Roaming" / app_name / "logs"
 
-    if system == "Darwin":
+    if _SYSTEM == "Darwin":
         return Path.home() / "Library" / "Application Support" / app_name / "logs"
 
     xdg_data_home = os.environ.get("XDG_DATA_HOME")
@@ -70,6 +82,73 @@ def get_default_log_dir(app_name: str = DEFAULT_APP_NAME) -> Path:
     return Path.home() / ".local" / "share" / app_name / "logs"
 
 
+_SIZE_UNITS = {"b": 1, "kb": 1024, "mb": 1024**2, "gb": 1024**3}
+_DURATION_UNITS = {
+    "second": 1.0,
+    "minute": 60.0,
+    "hour": 3600.0,
+    "day": 86400.0,
+    "week": 604800.0,
+}
+
+
+def _parse_size(value: str) -> int | None:
+    """Parse a loguru-style size string ("10 MB", "10485760") into bytes."""
+    stripped = value.strip()
+    if stripped.isdigit():
+        # loguru accepts a bare number of bytes.
+        return int(stripped)
+    parts = stripped.lower().split()
+    if len(parts) != 2:
+        return None
+    try:
+        amount = float(parts[0])
+    except ValueError:
+        return None
+    unit = _SIZE_UNITS.get(parts[1])
+    if unit is None:
+        return None
+    return int(amount * unit)
+
+
+def _parse_duration(value: str) -> float | None:
+    """Parse a loguru-style duration string ("7 days") into seconds, or None."""
+    parts = value.strip().lower().split()
+    if len(parts) != 2:
+        return None
+    try:
+        amount = float(parts[0])
+    except ValueError:
+        return None
+    unit = _DURATION_UNITS.get(parts[1].rstrip("s"))
+    if unit is None:
+        return None
+    return amount * unit
+
+
+def _parse_time_of_day(value: str) -> tuple[int, int, int] | None:
+    """Parse a loguru-style "HH:MM[:SS]" rotation time, or None."""
+    parts = value.strip().split(":")
+    if len(parts) not in (2, 3) or not all(part.isdigit() for part in parts):
+        return None
+    hour, minute = int(parts[0]), int(parts[1])
+    second = int(parts[2]) if len(parts) == 3 else 0
+    if hour < 24 and minute < 60 and second < 60:
+        return (hour, minute, second)
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _normalize_dir(value: str) -> Path:
+    """Normalize a log-dir string into a Path, memoized.
+
+    Re-initialization flows (tests, config reloads) hand the same
+    directory string in repeatedly; caching skips the normpath string
+    scan and the str + Path double allocation after the first call.
+    """
+    return Path(os.path.normpath(value))
+
+
 @dataclass(slots=True)
 class LogConfig:
     """Resolved logging configuration used by the runtime."""
@@ -84,14 +163,68 @@ class LogConfig:
     file_output: bool = True
     capture_stdlib: bool = True
     audit_enabled: bool = True
+    audit_batch_size: int = DEFAULT_AUDIT_BATCH_SIZE
+    audit_flush_interval: float = DEFAULT_AUDIT_FLUSH_INTERVAL
+    audit_max_queue: int = DEFAULT_AUDIT_MAX_QUEUE
+    audit_overflow_policy: str = DEFAULT_AUDIT_OVERFLOW_POLICY
+    audit_buffer_bytes: int = DEFAULT_AUDIT_BUFFER_BYTES
+    # Derived from rotation/retention once at construction so the write
+    # path never re-parses the human-readable strings.
+    rotation_bytes: int | None = field(default=None, init=False)
+    retention_seconds: float | None = field(default=None, init=False)
+    retention_count: int | None = field(default=None, init=False)
 
     def __post_init__(self) -> None:
         if self.log_dir is None:
             self.log_dir = get_default_log_dir(self.app_name)
+        elif isinstance(self.log_dir, Path) and self.log_dir.is_absolute():
+            # Absolute Path inputs are already canonical enough; skip the
+            # normpath string scan and re-allocation.
+            pass
         else:
-            self.log_dir = Path(os.path.normpath(os.fspath(self.log_dir)))
+            self.log_dir = _normalize_dir(os.fspath(self.log_dir))
 
         self.level = self.level.upper()
+        self._resolve_rotation()
+        self._resolve_retention()
+
+    def _resolve_rotation(self) -> None:
+        self.rotation_bytes = _parse_size(self.rotation)
+        if self.rotation_bytes is not None:
+            return
+        time_of_day = _parse_time_of_day(self.rotation)
+        if time_of_day is None:
+            warnings.warn(
+                f"Unrecognized rotation {self.rotation!r}; "
+                "falling back to daily rotation only.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        elif time_of_day != (0, 0, 0):
+            # The writer switches files at the day boundary; other
+            # rotation times are approximated to midnight.
+            warnings.warn(
+                f"Rotation time {self.rotation!r} is approximated to the "
+                "daily rollover at midnight.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+    def _resolve_retention(self) -> None:
+        self.retention_seconds = _parse_duration(self.retention)
+        if self.retention_seconds is not None:
+            return
+        stripped = self.retention.strip()
+        if stripped.isdigit():
+            # loguru accepts a bare file count.
+            self.retention_count = int(stripped)
+        else:
+            warnings.warn(
+                f"Unrecognized retention {self.retention!r}; "
+                "old log files will be kept.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
 
     @property
     def audit_log_dir(self) -> Path:
@@ -109,8 +242,19 @@ class LogConfig:
             "file_output": self.file_output,
             "capture_stdlib": self.capture_stdlib,
             "audit_enabled": self.audit_enabled,
+            "audit_batch_size": self.audit_batch_size,
+            "audit_flush_interval": self.audit_flush_interval,
+            "audit_max_queue": self.audit_max_queue,
+            "audit_overflow_policy": self.audit_overflow_policy,
+            "audit_buffer_bytes": self.audit_buffer_bytes,
         }
 
+    def _fallback_dir(self) -> Path:
+        """Cold path: resolve the temp-directory fallback for log output."""
+        import tempfile
+
+        return Path(tempfile.gettempdir()) / self.app_name / "logs"
+
     def ensure_log_dirs(self) -> None:
         """
         Ensure the configured log directory exists.
@@ -123,9 +267,7 @@ class LogConfig:
             if self.audit_enabled:
                 self.audit_log_dir.mkdir(parents=True, exist_ok=True)
         except Exception:
-            import tempfile
-
-            fallback = Path(tempfile.gettempdir()) / self.app_name / "logs"
+            fallback = self._fallback_dir()
             fallback.mkdir(parents=True, exist_ok=True)
             object.__setattr__(self, "log_dir", fallback)
             if self.audit_enabled:
@@ -141,7 +283,7 @@ class LogConfig:
         log_dir_env = os.environ.get(ENV_LOG_DIR)
         log_dir: Path | str | None
         if log_dir_env:
-            log_dir = Path(os.path.normpath(log_dir_env))
+            log_dir = _normalize_dir(log_dir_env)
         else:
             log_dir = get_default_log_dir(resolved_app_name)
 
@@ -7,12 +7,30 @@ from __future__ import annotations
 import json
 import logging
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger as _loguru_logger
 
+if TYPE_CHECKING:
+    # Typed as Any so the encoder selection below is analyzable whether
+    # or not the optional modules are installed.
+    _msgspec: Any = None
+    _orjson: Any = None
+else:
+    try:  # Optional speedups: pip install pylogkit[perf]
+        import msgspec as _msgspec
+    except ImportError:
+        _msgspec = None
+
+    try:
+        import orjson as _orjson
+    except ImportError:
+        _orjson = None
+
+from ._writer import BackgroundWriter
 from .config import (
     DEFAULT_APP_NAME,
     LogConfig,
@@ -28,17 +46,127 @@ DEFAULT_CONSOLE_FORMAT = (
     "| <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> "
     "| <level>{message}</level>"
 )
-DEFAULT_FILE_FORMAT = (
-    "{time:YYYY-MM-DD HH:mm:ss.SSS} "
-    "| {level: <8} "
-    "| {name}:{function}:{line} "
-    "| {message}"
-)
 DEFAULT_QT_FORMAT = "{time} | {level:<8} | {message}"
 
+
+def _file_format(record: dict[str, Any]) -> str:
+    """Build one file-sink line, bypassing loguru's format parser.
+
+    String formats are re-tokenized through the colorizer state machine
+    on every record; a dynamic format short-circuits that. The line is
+    assembled with a single f-string and handed back through ``extra``
+    in a constant template, mirroring the previous
+    ``{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} |
+    {name}:{function}:{line} | {message}`` layout.
+    """
+    t = record["time"]
+    record["extra"]["serialized"] = (
+        f"{t:%Y-%m-%d %H:%M:%S}.{t.microsecond // 1000:03d} "
+        f"| {record['level'].name: <8} "
+        f"| {record['name']}:{record['function']}:{record['line']} "
+        f"| {record['message']}"
+    )
+    return "{extra[serialized]}\n{exception}"
+
 _UNSET = object()
 
 
+# Serialize one JSON value to UTF-8 bytes. The fastest available
+# encoder is picked once at import time (msgspec > orjson > stdlib), so
+# the hot path calls a bound method with no feature-detection branch.
+if _msgspec is not None:
+    _serialize_audit_value = _msgspec.json.Encoder(enc_hook=str).encode
+elif _orjson is not None:
+    def _serialize_audit_value(value: Any) -> bytes:
+        data: bytes = _orjson.dumps(value, default=str)
+        return data
+else:
+    def _serialize_audit_value(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, default=str).encode("utf-8")
+
+# Matching decoder for reading audit lines back (orjson accepts bytes
+# or str directly; the stdlib fallback mirrors that).
+if _orjson is not None:
+    _deserialize_audit_line = _orjson.loads
+elif _msgspec is not None:
+    _deserialize_audit_line = _msgspec.json.Decoder(dict).decode
+else:
+    _deserialize_audit_line = json.loads
+
+
+# Two-level timestamp cache over time.time_ns(): the full string is
+# reused within the same millisecond, and the second-resolution prefix
+# ("YYYY-MM-DDTHH:MM:SS") is only re-formatted once per second — no
+# datetime object or tzinfo logic on the hot path. Tuple assignment is
+# atomic under the GIL, and <=1ms staleness is acceptable.
+_ts_ms_cache: tuple[int, bytes] = (0, b"")
+_ts_sec_cache: tuple[int, bytes] = (0, b"")
+
+
+def _audit_timestamp() -> bytes:
+    global _ts_ms_cache, _ts_sec_cache
+    ns = time.time_ns()
+    ms = ns // 1_000_000
+
+    cached_ms, cached = _ts_ms_cache
+    if ms == cached_ms and cached:
+        return cached
+
+    secs, frac_ns = divmod(ns, 1_000_000_000)
+    cached_sec, prefix = _ts_sec_cache
+    if secs != cached_sec or not prefix:
+        tm = time.localtime(secs)
+        prefix = (
+            f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+            f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+        ).encode()
+        _ts_sec_cache = (secs, prefix)
+
+    cached = prefix + b".%06d" % (frac_ns // 1000)
+    _ts_ms_cache = (ms, cached)
+    return cached
+
+
+# Frozen level tables: the mapping proxy guards against accidental
+# mutation, and the resolved threshold itself is cached as a plain int
+# on the manager at init time so the hot path never does a dict lookup
+# for the minimum level.
+_AUDIT_LEVEL_NO: MappingProxyType[str, int] = MappingProxyType(
+    {
+        "DEBUG": logging.DEBUG,
+        "INFO": logging.INFO,
+        "SUCCESS": 25,
+        "WARNING": logging.WARNING,
+        "ERROR": logging.ERROR,
+        "CRITICAL": logging.CRITICAL,
+    }
+)
+
+# "level" and "level_name" are constant per audit method, so the leading
+# JSON fragment can be frozen once instead of rebuilt per record.
+_AUDIT_LEVEL_PREFIX: MappingProxyType[str, bytes] = MappingProxyType(
+    {
+        name: f'{{"level":{no},"level_name":"{name}",'.encode()
+        for name, no in _AUDIT_LEVEL_NO.items()
+    }
+)
+
+
+# Facade-method name -> loguru level number, for the pre-dispatch level
+# check in LogFacade._emit. exception() logs at ERROR.
+_FACADE_LEVEL_NO: MappingProxyType[str, int] = MappingProxyType(
+    {
+        "debug": logging.DEBUG,
+        "info": logging.INFO,
+        "success": 25,
+        "warning": logging.WARNING,
+        "error": logging.ERROR,
+        "exception": logging.ERROR,
+        "critical": logging.CRITICAL,
+    }
+)
+
+
 class LoggingNotInitializedError(RuntimeError):
     """Raised when logging is used before init_logging()."""
 
@@ -85,6 +213,13 @@ class LogFacade:
         self._bound_logger = bound_logger
         self._options = options or {}
         self._depth = depth
+        # opt() allocates a new logger per call; the options of a facade
+        # are immutable, so the opt-ed logger is built once and reused,
+        # and its level methods are cached as bound callables so a hot
+        # emit is one dict lookup plus one call instead of getattr
+        # dispatch through the opt-ed logger every time.
+        self._opt_logger: Any | None = None
+        self._methods: dict[str, Any] = {}
 
     def _resolve_logger(self) -> Any:
         self._manager.require_initialized()
@@ -99,9 +234,21 @@ class LogFacade:
         return opt_kwargs
 
     def _emit(self, method_name: str, message: str, *args: Any, **kwargs: Any) -> None:
-        logger = self._resolve_logger()
-        opt_logger = logger.opt(**self._build_opt_kwargs())
-        getattr(opt_logger, method_name)(message, *args, **kwargs)
+        manager = self._manager
+        manager.require_initialized()
+        # Disabled levels bail on an integer compare before loguru
+        # captures the caller frame and builds a record.
+        if _FACADE_LEVEL_NO[method_name] < manager.min_level_no:
+            return
+        method = self._methods.get(method_name)
+        if method is None:
+            if self._opt_logger is None:
+                base = self._bound_logger or self._manager.base_logger
+                self._opt_logger = base.opt(**self._build_opt_kwargs())
+            method = self._methods[method_name] = getattr(
+                self._opt_logger, method_name
+            )
+        method(message, *args, **kwargs)
 
     def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         self._emit("debug", message, *args, **kwargs)
@@ -156,37 +303,62 @@ class LogFacade:
 class AuditFacade:
     """User-facing facade for structured audit logs."""
 
-    _LEVEL_TO_VALUE = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "SUCCESS": 25,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
-
     def __init__(self, manager: LoggingManager, *, depth: int = 2) -> None:
         self._manager = manager
         self._depth = depth
 
-    def _resolve_logger(self) -> Any:
+    @staticmethod
+    def parse_record(line: str | bytes) -> dict[str, Any]:
+        """Parse one audit JSONL line back into a dict."""
+        record: dict[str, Any] = _deserialize_audit_line(line)
+        return record
+
+    @staticmethod
+    def parse_file(path: str | Path) -> list[dict[str, Any]]:
+        """Parse a whole audit JSONL file in one pass.
+
+        Reads the file as a single bytes buffer and splits it once,
+        instead of decoding the file to text and parsing line by line.
+        """
+        data = Path(path).read_bytes()
+        return [_deserialize_audit_line(line) for line in data.split(b"\n") if line]
+
+    def is_enabled(self, level_name: str) -> bool:
+        """Return whether audit records at ``level_name`` would be written."""
         config = self._manager.require_initialized()
         if not config.audit_enabled:
-            raise RuntimeError("Audit logging is disabled.")
-        return self._manager.audit_logger
+            return False
+        level = _AUDIT_LEVEL_NO.get(level_name.upper(), 0)
+        return level >= self._manager.audit_min_level
 
     def _log(self, level_name: str, action: str, **kwargs: Any) -> None:
-        payload = {"action": action}
-        payload.update(kwargs)
-        record = {
-            "timestamp": datetime.now().isoformat(),
-            "level": self._LEVEL_TO_VALUE[level_name],
-            "level_name": level_name,
-            "action": action,
-            "data": payload,
-        }
-        message = json.dumps(record, ensure_ascii=False, default=str)
-        self._resolve_logger().opt(depth=self._depth).log(level_name, message)
+        # The whole check-filter-serialize-enqueue pipeline lives in one
+        # frame on purpose: this is the tightest loop in the module.
+        manager = self._manager
+        config = manager.require_initialized()
+        if not config.audit_enabled:
+            raise RuntimeError("Audit logging is disabled.")
+        if _AUDIT_LEVEL_NO[level_name] < manager.audit_min_level:
+            return
+        writer = manager.audit_writer
+        assert writer is not None
+
+        # kwargs is already the exact dict we want under "data" — no
+        # intermediate payload copy per record. The action rides in its
+        # own top-level field only.
+        line = b"".join(
+            (
+                _AUDIT_LEVEL_PREFIX[level_name],
+                b'"timestamp":"',
+                _audit_timestamp(),
+                b'","action":',
+                _serialize_audit_value(action),
+                b',"data":',
+                _serialize_audit_value(kwargs),
+                b"}",
+            )
+        )
+        writer.put(line)
 
     def debug(self, action: str, **kwargs: Any) -> None:
         self._log("DEBUG", action, **kwargs)
@@ -217,14 +389,30 @@ class LoggingManager:
         self._root_handler: logging.Handler | None = None
         self._previous_root_handlers: list[logging.Handler] = []
         self._previous_root_level: int = logging.NOTSET
+        self._audit_writer: BackgroundWriter | None = None
+        self._file_writer: BackgroundWriter | None = None
+        self._audit_min_level: int = logging.INFO
+        self._min_level_no: int = 0
+        # Live Qt handlers and their requested level (None = follow the
+        # config level), so set_level() can re-add their sinks after
+        # _configure_sinks() wipes every sink.
+        self._qt_sinks: list[tuple[Any, str | None]] = []
 
     @property
     def base_logger(self) -> Any:
         return self._logger
 
     @property
-    def audit_logger(self) -> Any:
-        return self._logger.bind(_pylogkit_audit=True)
+    def audit_writer(self) -> BackgroundWriter | None:
+        return self._audit_writer
+
+    @property
+    def audit_min_level(self) -> int:
+        return self._audit_min_level
+
+    @property
+    def min_level_no(self) -> int:
+        return self._min_level_no
 
     def require_initialized(self) -> LogConfig:
         if self._config is None or not self._initialized:
@@ -291,6 +479,10 @@ class LoggingManager:
 
     def _configure_sinks(self, config: LogConfig) -> None:
         self._logger.remove()
+        try:
+            self._min_level_no = self._logger.level(config.level).no
+        except ValueError:
+            self._min_level_no = 0
 
         if config.console_output and sys.stdout is not None:
             self._logger.add(
@@ -304,34 +496,69 @@ class LoggingManager:
             )
 
         if config.file_output:
-            log_file = Path(config.log_dir) / f"{config.app_name}_{{time:YYYY-MM-DD}}.log"
+            # The file sink feeds the bounded background writer instead
+            # of loguru's unbounded enqueue=True queue: the sink call is
+            # a deque append, and overload is capped by max_queue rather
+            # than growing RSS without limit.
+            template = f"{config.app_name}_{{day}}.log"
+            log_dir = Path(config.log_dir)
+            writer = self._file_writer
+            reused = writer is not None and writer.reconfigure(
+                log_dir,
+                filename_template=template,
+                rotation_bytes=config.rotation_bytes,
+                retention_seconds=config.retention_seconds,
+                retention_count=config.retention_count,
+            )
+            if not reused:
+                self._close_file_writer()
+                # 128 KiB coalescing buffer: message sinks are chattier
+                # than audit sinks, and 64-256 KiB is the sweet spot for
+                # write sizes on modern storage.
+                writer = self._file_writer = BackgroundWriter(
+                    log_dir,
+                    filename_template=template,
+                    frame=b"",
+                    buffer_bytes=128 * 1024,
+                    rotation_bytes=config.rotation_bytes,
+                    retention_seconds=config.retention_seconds,
+                    retention_count=config.retention_count,
+                )
+            assert writer is not None
+            encoding = config.encoding
+            put = writer.put
             self._logger.add(
-                str(log_file),
+                lambda message: put(message.encode(encoding)),
                 level=config.level,
-                format=DEFAULT_FILE_FORMAT,
-                rotation=config.rotation,
-                retention=config.retention,
-                encoding=config.encoding,
-                enqueue=True,
+                format=_file_format,
                 backtrace=True,
                 diagnose=True,
-                compression="zip",
                 filter=_is_core_record,
             )
+        else:
+            self._close_file_writer()
 
-        if config.audit_enabled:
-            audit_file = config.audit_log_dir / "audit_{time:YYYY-MM-DD}.jsonl"
-            self._logger.add(
-                str(audit_file),
-                level=config.level,
-                format="{message}",
-                rotation=config.rotation,
-                retention=config.retention,
-                encoding=config.encoding,
-                enqueue=True,
-                catch=True,
-                filter=_is_audit_record,
-            )
+        # logger.remove() above also dropped any attach_qt() sinks;
+        # reconnect them so set_level() re-levels rather than detaches
+        # the GUI.
+        for handler, qt_level in self._qt_sinks:
+            self._add_qt_sink(handler, qt_level or config.level)
+
+    def _add_qt_sink(self, handler: QtLogHandler, level: str) -> None:
+        self._logger.add(
+            lambda message: handler.emit(message.record),
+            level=level,
+            enqueue=True,
+            catch=True,
+            filter=_is_core_record,
+        )
+        # A Qt sink may accept lower levels than the file/console sinks;
+        # widen the facade fast-path threshold accordingly.
+        try:
+            qt_level_no = self._logger.level(level).no
+        except ValueError:
+            qt_level_no = 0
+        self._min_level_no = min(self._min_level_no, qt_level_no)
 
     def init_logging(
         self,
@@ -362,8 +589,45 @@ class LoggingManager:
         config.ensure_log_dirs()
 
         self._remove_stdlib_bridge()
+        # Re-initialization starts a fresh runtime: Qt handlers from the
+        # previous one are not carried over (callers re-attach after
+        # init_logging, as with every other sink).
+        self._qt_sinks.clear()
         self._configure_sinks(config)
 
+        self._audit_min_level = _AUDIT_LEVEL_NO.get(config.level, logging.INFO)
+        if config.audit_enabled:
+            # Re-initialization reuses the live writer thread where
+            # possible; only a buffer-semantics change forces a respawn.
+            writer = self._audit_writer
+            reused = writer is not None and writer.reconfigure(
+                config.audit_log_dir,
+                batch_size=config.audit_batch_size,
+                flush_interval=config.audit_flush_interval,
+                max_queue=config.audit_max_queue,
+                overflow_policy=config.audit_overflow_policy,
+                buffer_bytes=config.audit_buffer_bytes,
+                rotation_bytes=config.rotation_bytes,
+                retention_seconds=config.retention_seconds,
+                retention_count=config.retention_count,
+            )
+            if not reused:
+                self._close_audit_writer()
+                self._audit_writer = BackgroundWriter(
+                    config.audit_log_dir,
+                    filename_template="audit_{day}.jsonl",
+                    batch_size=config.audit_batch_size,
+                    flush_interval=config.audit_flush_interval,
+                    max_queue=config.audit_max_queue,
+                    overflow_policy=config.audit_overflow_policy,
+                    buffer_bytes=config.audit_buffer_bytes,
+                    rotation_bytes=config.rotation_bytes,
+                    retention_seconds=config.retention_seconds,
+                    retention_count=config.retention_count,
+                )
+        else:
+            self._close_audit_writer()
+
         if config.capture_stdlib:
             self._install_stdlib_bridge()
 
@@ -376,6 +640,7 @@ class LoggingManager:
         *,
         level: str | None = None,
         format_string: str | None = None,
+        buffer_enabled: bool = False,
     ) -> QtLogHandler:
         config = self.require_initialized()
 
@@ -390,19 +655,62 @@ class LoggingManager:
         handler = QtLogHandler(
             emitter=emitter,
             format_string=format_string or DEFAULT_QT_FORMAT,
+            buffer_enabled=buffer_enabled,
         )
-        self._logger.add(
-            lambda message: handler.emit(message.record),
-            level=level or config.level,
-            enqueue=True,
-            catch=True,
-            filter=_is_core_record,
-        )
+        self._qt_sinks.append((handler, level))
+        self._add_qt_sink(handler, level or config.level)
         return handler
 
+    def set_level(self, level: str) -> None:
+        config = self.require_initialized()
+        normalized = level.upper()
+        if normalized == config.level:
+            return
+
+        # Loguru levels live per sink, so the sinks are re-added — but the
+        # background writers are reused via reconfigure() (same
+        # destination keeps the open fd), so no file is closed, reopened
+        # or rotated and no writer thread is respawned.
+        config.level = normalized
+        self._configure_sinks(config)
+        self._audit_min_level = _AUDIT_LEVEL_NO.get(normalized, logging.INFO)
+
+    def flush_logging(self, timeout: float = 10.0) -> bool:
+        self.require_initialized()
+        # Console/Qt sinks ride loguru's enqueue=True queue; complete()
+        # drains it. The file and audit writers then confirm their own
+        # queues are on disk, each within what remains of the deadline —
+        # a writer that cannot complete surfaces as False rather than
+        # blocking the caller indefinitely.
+        deadline = time.monotonic() + timeout
+        self._logger.complete()
+        flushed = True
+        if self._file_writer is not None:
+            flushed &= self._file_writer.flush(
+                max(0.0, deadline - time.monotonic())
+            )
+        if self._audit_writer is not None:
+            flushed &= self._audit_writer.flush(
+                max(0.0, deadline - time.monotonic())
+            )
+        return flushed
+
+    def _close_audit_writer(self) -> None:
+        if self._audit_writer is not None:
+            self._audit_writer.close()
+            self._audit_writer = None
+
+    def _close_file_writer(self) -> None:
+        if self._file_writer is not None:
+            self._file_writer.close()
+            self._file_writer = None
+
     def shutdown_logging(self) -> None:
         self._remove_stdlib_bridge()
+        self._qt_sinks.clear()
         self._logger.remove()
+        self._close_audit_writer()
+        self._close_file_writer()
         self._config = None
         self._initialized = False
 
@@ -444,14 +752,30 @@ def attach_qt(
     *,
     level: str | None = None,
     format_string: str | None = None,
+    buffer_enabled: bool = False,
 ) -> QtLogHandler:
     return _logging_manager.attach_qt(
         emitter=emitter,
         level=level,
         format_string=format_string,
+        buffer_enabled=buffer_enabled,
     )
 
 
+def set_level(level: str) -> None:
+    """Change the minimum log level without reopening log files."""
+    _logging_manager.set_level(level)
+
+
+def flush_logging(timeout: float = 10.0) -> bool:
+    """Block until all records logged so far are written to disk.
+
+    Returns ``False`` if the writers could not confirm completion
+    within ``timeout`` seconds.
+    """
+    return _logging_manager.flush_logging(timeout)
+
+
 def shutdown_logging() -> None:
     _logging_manager.shutdown_logging()
 
@@ -462,6 +786,8 @@ __all__ = [
     "AuditFacade",
     "init_logging",
     "attach_qt",
+    "set_level",
+    "flush_logging",
     "shutdown_logging",
     "log",
     "audit",
@@ -19,11 +19,14 @@ log.info("这条日志会转发到 Qt")
 ```
 """
 
+import itertools
 import threading
 import warnings
+from collections import deque
 from collections.abc import Callable
 from logging import Handler, LogRecord
 from typing import Any
+from weakref import WeakSet
 
 # 尝试导入 PyQt 模块
 QObject: type
@@ -198,6 +201,61 @@ class LogSignalEmitter(QObject):
         self.log_message.connect(callback)
 
 
+def _parse_logrecord(record: LogRecord) -> dict[str, Any]:
+    """把 Python 标准 logging 记录转换为统一字典格式"""
+    return {
+        "message": record.getMessage(),
+        "level": record.levelname,
+        "time": record.created,
+        "name": record.name,
+        "function": record.funcName,
+        "line": record.lineno,
+        "exception": None,
+        "extra": {},
+    }
+
+
+def _parse_fallback(record: Any) -> dict[str, Any]:
+    """兜底处理，避免意外输入导致 GUI sink 失败"""
+    return {
+        "message": str(record),
+        "level": "INFO",
+        "time": "",
+        "name": "",
+        "function": "",
+        "line": 0,
+        "exception": None,
+        "extra": {},
+    }
+
+
+# 精确类型分发表：一次哈希查找代替逐个 isinstance 判断；
+# 子类等不常见类型走 _parse_record 中的慢路径
+_PARSERS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    dict: lambda record: record,
+    LogRecord: _parse_logrecord,
+}
+
+
+# 常见级别名是固定的全大写字符串，命中即可原样返回，
+# 省去每条记录一次 str() + upper() 的两次字符串分配
+_KNOWN_LEVELS = frozenset(
+    {"TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"}
+)
+
+
+def _record_level_name(record: dict[str, Any]) -> str:
+    """提取记录的级别名（兼容 loguru 级别对象 / 字典 / 字符串）"""
+    level_value = record.get("level", "INFO")
+    if isinstance(level_value, dict):
+        name = level_value.get("name", "INFO")
+    else:
+        name = getattr(level_value, "name", level_value)
+    if isinstance(name, str) and name in _KNOWN_LEVELS:
+        return name
+    return str(name).upper()
+
+
 class QtLogHandler:
     """
     Qt 日志处理器
@@ -215,10 +273,27 @@ class QtLogHandler:
         format_string: 日志格式字符串
     """
 
+    # 类级共享发射器注册表：多窗口场景下向同一个 handler 注册
+    # 多个发射器，每条记录只格式化一次即可广播到所有消费者，
+    # 避免为每个窗口各挂一个 sink 重复格式化。弱引用集合不会
+    # 阻止发射器随窗口销毁被回收
+    _shared_emitters: "WeakSet[LogSignalEmitter]" = WeakSet()
+
+    @classmethod
+    def register_shared_emitter(cls, emitter: "LogSignalEmitter") -> None:
+        """注册一个共享发射器，接收所有 handler 的广播"""
+        cls._shared_emitters.add(emitter)
+
+    @classmethod
+    def unregister_shared_emitter(cls, emitter: "LogSignalEmitter") -> None:
+        """移除一个共享发射器"""
+        cls._shared_emitters.discard(emitter)
+
     def __init__(
         self,
         emitter: LogSignalEmitter | None = None,
         format_string: str = "{time} | {level:<8} | {message}",
+        buffer_enabled: bool = False,
     ) -> None:
         """
         初始化 Qt 日志处理器
@@ -226,12 +301,19 @@ class QtLogHandler:
         Args:
             emitter: LogSignalEmitter 实例，如果为 None 则自动创建
             format_string: 日志格式字符串，用于格式化日志消息
+            buffer_enabled: 是否保留最近消息缓冲（供 get_buffer 读取）。
+                           多数 GUI 直接连接信号，无需缓冲，默认关闭
         """
         self.emitter = emitter or LogSignalEmitter()
         self.format_string = format_string
-        self._lock = threading.Lock()
-        self._message_buffer: list[str] = []
+        self.buffer_enabled = buffer_enabled
+        # deque 在 GIL 下 append/popleft 原子且 maxlen 自动淘汰最旧消息，
+        # 无需持锁，也避免了 list.pop(0) 的 O(n) 搬移
         self._buffer_size = 100
+        # 按列存储（消息列 + 级别列）而非每条记录一个字典，
+        # 级别过滤可直接在级别列上进行
+        self._message_buffer: deque[str] = deque(maxlen=self._buffer_size)
+        self._level_buffer: deque[str] = deque(maxlen=self._buffer_size)
 
         if not HAS_PYQT:
             warnings.warn(
@@ -258,18 +340,23 @@ class QtLogHandler:
             # 格式化消息
             formatted_message = self._format_message(parsed_record)
 
-            # 线程安全地发射信号
-            with self._lock:
-                # 发射完整记录
-                self.emitter.emit_record(parsed_record)
+            # 发射完整记录（Qt 跨线程信号本身经队列连接保证安全）
+            self.emitter.emit_record(parsed_record)
 
-                # 发射格式化消息
-                self.emitter.emit_message(formatted_message)
+            # 发射格式化消息
+            self.emitter.emit_message(formatted_message)
 
-                # 添加到缓冲区
+            # 广播到共享发射器（格式化结果直接复用，不重复格式化）
+            for shared in self._shared_emitters:
+                if shared is not self.emitter:
+                    shared.emit_record(parsed_record)
+                    shared.emit_message(formatted_message)
+
+            # 添加到缓冲区（满时由 maxlen 自动淘汰最旧消息）；
+            # 未开启缓冲时完全跳过，包括级别名提取
+            if self.buffer_enabled:
                 self._message_buffer.append(formatted_message)
-                if len(self._message_buffer) > self._buffer_size:
-                    self._message_buffer.pop(0)
+                self._level_buffer.append(_record_level_name(parsed_record))
 
         except Exception as e:
             # 发射失败时不应抛出异常，避免日志循环
@@ -287,51 +374,17 @@ class QtLogHandler:
         Returns:
             标准化的日志记录字典
         """
+        parser = _PARSERS.get(type(record))
+        if parser is not None:
+            return parser(record)
+
+        # 慢路径：dict / LogRecord 的子类仍按继承关系处理
         if isinstance(record, dict):
-            level_value = record.get("level", "INFO")
-            if isinstance(level_value, dict):
-                level_name = level_value.get("name", "INFO")
-            elif hasattr(level_value, "name"):
-                level_name = str(level_value.name)
-            else:
-                level_name = str(level_value)
-
-            # loguru 格式
-            return {
-                "message": record.get("message", ""),
-                "level": level_name,
-                "time": record.get("time", ""),
-                "name": record.get("name", ""),
-                "function": record.get("function", ""),
-                "line": record.get("line", 0),
-                "exception": record.get("exception", None),
-                "extra": record.get("extra", {}),
-            }
-
-        elif isinstance(record, LogRecord):
-            # Python 标准 logging 格式
-            return {
-                "message": record.getMessage(),
-                "level": record.levelname,
-                "time": record.created,
-                "name": record.name,
-                "function": record.funcName,
-                "line": record.lineno,
-                "exception": None,
-                "extra": {},
-            }
-
-        # 兜底处理，避免意外输入导致 GUI sink 失败
-        return {
-            "message": str(record),
-            "level": "INFO",
-            "time": "",
-            "name": "",
-            "function": "",
-            "line": 0,
-            "exception": None,
-            "extra": {},
-        }
+            # loguru 记录本身已经是包含全部所需键的字典，直接复用
+            return record
+        if isinstance(record, LogRecord):
+            return _parse_logrecord(record)
+        return _parse_fallback(record)
 
     def _format_message(self, record: dict[str, Any]) -> str:
         """
@@ -350,7 +403,7 @@ class QtLogHandler:
 
             formatted = self.format_string.format(
                 time=time_str,
-                level=str(record.get("level", "INFO")).upper(),
+                level=_record_level_name(record),
                 message=str(record.get("message", "")),
                 name=str(record.get("name", "")),
                 function=str(record.get("function", "")),
@@ -361,20 +414,31 @@ class QtLogHandler:
             # 格式化失败时返回原始消息
             return str(record.get("message", ""))
 
-    def get_buffer(self) -> list[str]:
+    def get_buffer(self, level: str | None = None) -> list[str]:
         """
         获取日志缓冲区内容
 
+        Args:
+            level: 可选的级别名过滤（如 "ERROR"），只返回该级别的消息
+
         Returns:
             最近的日志消息列表
         """
-        with self._lock:
-            return self._message_buffer.copy()
+        messages = list(self._message_buffer)
+        if level is None:
+            return messages
+
+        # 在级别列上向量化过滤，无需解析消息文本
+        wanted = level.upper()
+        levels = list(self._level_buffer)
+        return list(
+            itertools.compress(messages, (name == wanted for name in levels))
+        )
 
     def clear_buffer(self) -> None:
         """清空日志缓冲区"""
-        with self._lock:
-            self._message_buffer.clear()
+        self._message_buffer.clear()
+        self._level_buffer.clear()
 
 class QtLoggingHandler(Handler):
     """
@@ -11,11 +11,11 @@ from typing import Any, TypeVar, overload
 F = TypeVar("F", bound=Callable[..., Any])
 
 
-def _default_exception_logger(message: str) -> None:
+def _default_exception_logger(message: str, *args: Any) -> None:
     """Log an exception message through the active PyLogKit logger."""
     from .core import log
 
-    log.opt(depth=-1).exception(message)
+    log.opt(depth=-1).exception(message, *args)
 
 
 @overload
@@ -42,19 +42,33 @@ def catch_exceptions(
     Decorate a function to log any exception raised during execution.
     """
     resolved_logger = logger_func or _default_exception_logger
+    # The default logger takes loguru's template-plus-args form, so the
+    # message (including str(exc)) is only rendered if the record passes
+    # level filtering. Custom logger_func callables keep receiving one
+    # pre-formatted string.
+    lazy = logger_func is None
 
     def decorator(target: F) -> F:
+        # The message prefix is constant per decoration site, so it is
+        # rendered once here instead of per raised exception.
+        prefix = (
+            f"Function {target.__name__} raised an exception"
+            if message is None
+            else message
+        )
+
+        # Plain closure captures: default-binding the hot values would
+        # shave a few LOAD_DEREFs, but any keyword default also swallows
+        # a caller kwarg of the same name instead of forwarding it.
         @functools.wraps(target)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return target(*args, **kwargs)
             except Exception as exc:
-                if message is None:
-                    error_message = f"Function {target.__name__} raised an exception: {exc}"
+                if lazy:
+                    resolved_logger("{}: {}", prefix, exc)
                 else:
-                    error_message = f"{message}: {exc}"
-
-                resolved_logger(error_message)
+                    resolved_logger(f"{prefix}: {exc}")
                 if reraise:
                     raise
                 return None
@@ -1,8 +1,6 @@
-import time
-
 import pytest
 
-from pylogkit import shutdown_logging
+from pylogkit import flush_logging, shutdown_logging
 
 
 @pytest.fixture(autouse=True)
@@ -13,5 +11,8 @@ def reset_logging_runtime():
 
 
 def wait_for_log_writes() -> None:
-    time.sleep(0.25)
-
+    # Deterministic barrier: drains loguru's enqueue queues and the
+    # background writers instead of sleeping an arbitrary interval.
+    # Bounded so a wedged writer fails the test instead of hanging
+    # the whole suite.
+    assert flush_logging(timeout=5.0)
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from pylogkit import LogConfig
 from pylogkit.config import (
     ENV_LOG_AUDIT_ENABLED,
@@ -14,10 +16,10 @@ from pylogkit.config import (
 
 
 def test_get_default_log_dir_includes_app_name():
-    log_dir = get_default_log_dir("demo-app")
+    log_dir = str(get_default_log_dir("demo-app"))
 
-    assert "demo-app" in str(log_dir)
-    assert "logs" in str(log_dir)
+    assert "demo-app" in log_dir
+    assert "logs" in log_dir
 
 
 def test_log_config_from_env(monkeypatch, tmp_path: Path):
@@ -31,14 +33,45 @@ def test_log_config_from_env(monkeypatch, tmp_path: Path):
 
     config = LogConfig.from_env(app_name="demo")
 
-    assert config.app_name == "demo"
-    assert config.log_dir == tmp_path
-    assert config.level == "DEBUG"
-    assert config.rotation == "5 MB"
-    assert config.retention == "14 days"
-    assert config.encoding == "utf-16"
-    assert config.capture_stdlib is False
-    assert config.audit_enabled is False
+    # One tuple compare; pytest still names the differing position on
+    # failure.
+    assert (
+        config.app_name,
+        config.log_dir,
+        config.level,
+        config.rotation,
+        config.retention,
+        config.encoding,
+        config.capture_stdlib,
+        config.audit_enabled,
+    ) == ("demo", tmp_path, "DEBUG", "5 MB", "14 days", "utf-16", False, False)
+
+
+def test_log_config_accepts_bare_number_rotation_and_retention(tmp_path: Path):
+    config = LogConfig(
+        app_name="demo", log_dir=tmp_path, rotation="10485760", retention="5"
+    )
+
+    assert config.rotation_bytes == 10485760
+    assert config.retention_seconds is None
+    assert config.retention_count == 5
+
+
+def test_log_config_accepts_time_of_day_rotation(tmp_path: Path, recwarn):
+    config = LogConfig(app_name="demo", log_dir=tmp_path, rotation="00:00")
+
+    # Midnight rotation is exactly the writer's daily rollover; no size
+    # threshold and no warning.
+    assert config.rotation_bytes is None
+    assert not recwarn.list
+
+
+def test_log_config_warns_on_unrecognized_rotation_and_retention(tmp_path: Path):
+    with pytest.warns(RuntimeWarning, match="rotation"):
+        LogConfig(app_name="demo", log_dir=tmp_path, rotation="banana")
+
+    with pytest.warns(RuntimeWarning, match="retention"):
+        LogConfig(app_name="demo", log_dir=tmp_path, retention="banana")
 
 
 def test_log_config_ensure_log_dirs_falls_back(monkeypatch, tmp_path: Path):
@@ -46,9 +79,13 @@ def test_log_config_ensure_log_dirs_falls_back(monkeypatch, tmp_path: Path):
     config = LogConfig(app_name="demo", log_dir=invalid_dir)
 
     original_mkdir = Path.mkdir
+    # Compare raw fspath strings: mkdir is intercepted for every
+    # directory the fallback path creates, and Path.__eq__ would
+    # re-derive the casefolded key per call.
+    target = invalid_dir.__fspath__()
 
     def fake_mkdir(self, *args, **kwargs):
-        if self == invalid_dir:
+        if self.__fspath__() == target:
             raise PermissionError("denied")
         return original_mkdir(self, *args, **kwargs)
 
@@ -1,6 +1,7 @@
 import inspect
 import json
 import logging
+import os
 from pathlib import Path
 
 import pytest
@@ -8,23 +9,39 @@ import pytest
 from pylogkit import (
     LoggingNotInitializedError,
     audit,
+    flush_logging,
     init_logging,
     log,
+    set_level,
     shutdown_logging,
 )
 from tests.conftest import wait_for_log_writes
 
 
+def _scan_log_files(directory: Path, prefix: str, suffix: str) -> list[str]:
+    # os.scandir avoids the per-entry stat and Path allocation of glob()
+    with os.scandir(directory) as entries:
+        return sorted(
+            entry.path
+            for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+        )
+
+
 def _read_main_log(log_dir: Path, app_name: str) -> str:
-    log_files = sorted(log_dir.glob(f"{app_name}_*.log"))
+    log_files = _scan_log_files(log_dir, f"{app_name}_", ".log")
     assert log_files, "expected main log file to exist"
-    return log_files[0].read_text(encoding="utf-8")
+    return Path(log_files[0]).read_text(encoding="utf-8")
 
 
 def _read_audit_lines(log_dir: Path) -> list[str]:
-    audit_files = sorted((log_dir / "audit").glob("audit_*.jsonl"))
+    audit_files = _scan_log_files(log_dir / "audit", "audit_", ".jsonl")
     assert audit_files, "expected audit log file to exist"
-    return [line for line in audit_files[0].read_text(encoding="utf-8").splitlines() if line]
+    return [
+        line
+        for line in Path(audit_files[0]).read_text(encoding="utf-8").splitlines()
+        if line
+    ]
 
 
 def test_log_requires_initialization():
@@ -67,6 +84,24 @@ def test_reinitialization_replaces_previous_runtime(tmp_path: Path):
     assert "second run" in second_content
 
 
+def test_reinitialization_redirects_audit_writer(tmp_path: Path):
+    first_dir = tmp_path / "first"
+    second_dir = tmp_path / "second"
+
+    init_logging("demo", log_dir=first_dir, console_output=False)
+    audit.info("first_action")
+
+    init_logging("demo", log_dir=second_dir, console_output=False)
+    audit.info("second_action")
+    wait_for_log_writes()
+
+    first_lines = _read_audit_lines(first_dir)
+    second_lines = _read_audit_lines(second_dir)
+
+    assert [json.loads(line)["action"] for line in first_lines] == ["first_action"]
+    assert [json.loads(line)["action"] for line in second_lines] == ["second_action"]
+
+
 def test_log_caller_points_to_business_code(tmp_path: Path):
     init_logging("demo", log_dir=tmp_path, console_output=False)
 
@@ -142,6 +177,95 @@ def test_shutdown_blocks_future_logging(tmp_path: Path):
         audit.info("after_shutdown")
 
 
+def test_audit_below_configured_level_is_filtered(tmp_path: Path):
+    init_logging("demo", log_dir=tmp_path, console_output=False, level="WARNING")
+
+    assert audit.is_enabled("WARNING")
+    assert not audit.is_enabled("DEBUG")
+
+    audit.debug("filtered_action")
+    audit.warning("kept_action")
+    wait_for_log_writes()
+
+    audit_lines = _read_audit_lines(tmp_path)
+    assert len(audit_lines) == 1
+    assert json.loads(audit_lines[0])["action"] == "kept_action"
+
+
+def test_rotation_splits_main_log_by_size(tmp_path: Path):
+    init_logging("demo", log_dir=tmp_path, console_output=False, rotation="1 KB")
+
+    for index in range(20):
+        log.info("rotation filler {} {}", index, "x" * 100)
+    wait_for_log_writes()
+    for index in range(20, 40):
+        log.info("rotation filler {} {}", index, "x" * 100)
+    wait_for_log_writes()
+
+    log_files = _scan_log_files(tmp_path, "demo_", ".log")
+    assert len(log_files) >= 2
+
+
+def test_set_level_changes_filtering_in_place(tmp_path: Path):
+    init_logging("demo", log_dir=tmp_path, console_output=False)
+
+    log.debug("debug before")
+    set_level("DEBUG")
+    log.debug("debug after")
+    wait_for_log_writes()
+
+    content = _read_main_log(tmp_path, "demo")
+    assert "debug before" not in content
+    assert "debug after" in content
+
+
+def test_set_level_requires_initialization():
+    with pytest.raises(LoggingNotInitializedError):
+        set_level("DEBUG")
+
+
+def test_flush_logging_requires_initialization():
+    with pytest.raises(LoggingNotInitializedError):
+        flush_logging()
+
+
+def test_flush_logging_makes_records_immediately_visible(tmp_path: Path):
+    init_logging("demo", log_dir=tmp_path, console_output=False)
+
+    log.info("flushed message")
+    audit.info("flushed_action")
+    flush_logging()
+
+    assert "flushed message" in _read_main_log(tmp_path, "demo")
+    assert json.loads(_read_audit_lines(tmp_path)[0])["action"] == "flushed_action"
+
+
+def test_audit_parse_record_round_trips(tmp_path: Path):
+    init_logging("demo", log_dir=tmp_path, console_output=False)
+
+    audit.info("user_login", user="carol", attempts=2)
+    wait_for_log_writes()
+
+    parsed = audit.parse_record(_read_audit_lines(tmp_path)[0])
+    assert parsed["action"] == "user_login"
+    assert parsed["level_name"] == "INFO"
+    assert parsed["data"]["user"] == "carol"
+    assert parsed["data"]["attempts"] == 2
+
+
+def test_audit_parse_file_reads_all_records(tmp_path: Path):
+    init_logging("demo", log_dir=tmp_path, console_output=False)
+
+    audit.info("first")
+    audit.info("second")
+    audit.info("third")
+    wait_for_log_writes()
+
+    audit_files = _scan_log_files(tmp_path / "audit", "audit_", ".jsonl")
+    records = audit.parse_file(audit_files[0])
+    assert [record["action"] for record in records] == ["first", "second", "third"]
+
+
 def test_audit_disabled_raises_when_used(tmp_path: Path):
     init_logging("demo", log_dir=tmp_path, console_output=False, audit_enabled=False)
 
@@ -1,10 +1,15 @@
-import warnings
 from pathlib import Path
 
 import pytest
 
 import pylogkit.qt_integration as qt_module
-from pylogkit import LoggingNotInitializedError, attach_qt, init_logging, log
+from pylogkit import (
+    LoggingNotInitializedError,
+    attach_qt,
+    init_logging,
+    log,
+    set_level,
+)
 from pylogkit.qt_integration import QtLogHandler
 from tests.conftest import wait_for_log_writes
 
@@ -25,9 +30,10 @@ def test_attach_qt_forwards_messages(monkeypatch, tmp_path: Path):
     init_logging("demo", log_dir=tmp_path, console_output=False)
 
     class FakeQtHandler:
-        def __init__(self, emitter=None, format_string=None):
+        def __init__(self, emitter=None, format_string=None, buffer_enabled=False):
             self.emitter = emitter
             self.format_string = format_string
+            self.buffer_enabled = buffer_enabled
             self.records = []
             self.buffer = []
 
@@ -50,10 +56,30 @@ def test_attach_qt_forwards_messages(monkeypatch, tmp_path: Path):
     assert handler.get_buffer() == ["qt message"]
 
 
+def test_qt_sink_survives_set_level(monkeypatch, tmp_path: Path):
+    init_logging("demo", log_dir=tmp_path, console_output=False)
+
+    class FakeQtHandler:
+        def __init__(self, emitter=None, format_string=None, buffer_enabled=False):
+            self.records = []
+
+        def emit(self, record):
+            self.records.append(record)
+
+    monkeypatch.setattr(qt_module, "has_pyqt", lambda: True)
+    monkeypatch.setattr(qt_module, "QtLogHandler", FakeQtHandler)
+
+    handler = attach_qt()
+    set_level("DEBUG")
+    log.debug("after set_level")
+    wait_for_log_writes()
+
+    assert [record["message"] for record in handler.records] == ["after set_level"]
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
 def test_qt_log_handler_uses_format_string():
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore", RuntimeWarning)
-        handler = QtLogHandler(format_string="{level}::{message}")
+    handler = QtLogHandler(format_string="{level}::{message}")
     formatted = handler._format_message(
         {
             "time": "2026-03-15 10:00:00.000",
@@ -33,3 +33,11 @@ def test_catch_exceptions_supports_custom_logger():
 
     assert captured == ["custom: fail"]
 
+
+
+def test_catch_exceptions_forwards_underscore_kwargs():
+    @catch_exceptions(reraise=False)
+    def echo(**kwargs):
+        return kwargs
+
+    assert echo(a=1, _target=2, _prefix="x") == {"a": 1, "_target": 2, "_prefix": "x"}
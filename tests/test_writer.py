@@ -0,0 +1,114 @@
+import json
+import os
+from pathlib import Path
+
+from pylogkit._writer import BackgroundWriter
+
+
+def _read_lines(path: Path) -> list[str]:
+    return [line for line in path.read_text(encoding="utf-8").splitlines() if line]
+
+
+def test_flush_completes_under_drop_oldest_overflow(tmp_path: Path):
+    writer = BackgroundWriter(
+        tmp_path, filename_template="w_{day}.log", max_queue=8
+    )
+    try:
+        # Flood far past max_queue so eviction keeps running while the
+        # flush marker is in flight; the barrier must survive it.
+        for _burst in range(3):
+            for index in range(2000):
+                writer.put(b'{"index": %d}' % index)
+            assert writer.flush(timeout=5.0)
+    finally:
+        writer.close()
+
+
+def test_redirect_survives_drop_oldest_overflow(tmp_path: Path):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    writer = BackgroundWriter(
+        first, filename_template="w_{day}.log", max_queue=8
+    )
+    try:
+        for index in range(500):
+            writer.put(b'{"run": 1, "index": %d}' % index)
+        assert writer.reconfigure(second, max_queue=8)
+        for index in range(500):
+            writer.put(b'{"run": 2, "index": %d}' % index)
+        assert writer.flush(timeout=5.0)
+
+        second_files = list(second.glob("w_*.log"))
+        assert second_files
+        assert all(
+            json.loads(line)["run"] == 2
+            for line in _read_lines(second_files[0])
+        )
+    finally:
+        writer.close()
+
+
+def test_gc_keeps_newest_files_for_count_retention(tmp_path: Path):
+    for index in range(5):
+        path = tmp_path / f"w_2026-01-0{index + 1}.log"
+        path.write_text("x")
+        os.utime(path, (index, index))
+
+    writer = BackgroundWriter(
+        tmp_path, filename_template="w_{day}.log", retention_count=2
+    )
+    try:
+        writer._gc_old_files()
+        remaining = sorted(entry.name for entry in tmp_path.glob("w_*.log"))
+        assert remaining == ["w_2026-01-04.log", "w_2026-01-05.log"]
+    finally:
+        writer.close()
+
+
+def test_reconfigure_back_to_original_destination_redirects(tmp_path: Path):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    writer = BackgroundWriter(first, filename_template="w_{day}.log")
+    try:
+        # A -> B -> A must queue a redirect back even though the drain
+        # thread may not have applied the A -> B switch yet.
+        assert writer.reconfigure(second)
+        assert writer.reconfigure(first)
+        writer.put(b'{"destination": "first"}')
+        assert writer.flush(timeout=5.0)
+
+        first_files = list(first.glob("w_*.log"))
+        assert first_files
+        assert '"first"' in first_files[0].read_text(encoding="utf-8")
+    finally:
+        writer.close()
+
+
+def test_writer_survives_unwritable_destination(tmp_path: Path):
+    missing = tmp_path / "missing" / "logs"
+    writer = BackgroundWriter(missing, filename_template="w_{day}.log")
+    try:
+        # The open fails (parent directory does not exist); the record
+        # is dropped and counted, but the drain thread must stay up and
+        # the flush barrier must still complete.
+        writer.put(b"lost")
+        assert writer.flush(timeout=5.0)
+        assert writer._thread.is_alive()
+        assert writer.dropped_count == 1
+
+        # Once the destination exists, the next batch writes normally.
+        missing.mkdir(parents=True)
+        writer.put(b"recovered")
+        assert writer.flush(timeout=5.0)
+    finally:
+        writer.close()
+
+    files = sorted(missing.iterdir())
+    assert files
+    assert _read_lines(files[0]) == ["recovered"]